@@ -382,6 +382,15 @@ def _save_raw_payload(
 ) -> Path:
     """Guarda el JSON con creación exclusiva y elimina archivos parciales."""
 
+    try:
+        serialized = (
+            json.dumps(payload, ensure_ascii=False, indent=2) + "\n"
+        ).encode("utf-8")
+    except (TypeError, ValueError):
+        raise RawDataWriteError(
+            "No fue posible serializar el JSON crudo"
+        ) from None
+
     ensure_data_directories(paths)
     timestamp_text = extracted_at.strftime("%Y%m%dT%H%M%S%fZ")
 
@@ -392,18 +401,12 @@ def _save_raw_payload(
             / f"air_quality_{timestamp_text}_{token}.json"
         )
         try:
-            with raw_path.open("x", encoding="utf-8") as file_handle:
-                json.dump(
-                    payload,
-                    file_handle,
-                    ensure_ascii=False,
-                    indent=2,
-                )
-                file_handle.write("\n")
+            with raw_path.open("xb") as file_handle:
+                file_handle.write(serialized)
             return raw_path
         except FileExistsError:
             continue
-        except (OSError, TypeError, ValueError):
+        except OSError:
             raw_path.unlink(missing_ok=True)
             raise RawDataWriteError(
                 f"No fue posible guardar el JSON crudo: {raw_path.name}"
@@ -10,6 +10,8 @@ from pathlib import Path
 from typing import Any, Callable, Literal
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 from sqlalchemy import (
     Column,
     Float,
@@ -34,6 +36,7 @@ from etl.transform import (
 
 
 TABLE_NAME = "calidad_aire"
+_PARQUET_COMPRESSION = "zstd"
 _SHA256_HEX = re.compile(r"^[0-9a-fA-F]{64}$")
 _TransactionStatus = Literal["committed", "rolled_back", "no_changes"]
 _ExportStatus = Literal["exported", "failed"]
@@ -416,10 +419,12 @@ def _write_parquet_file(
 ) -> None:
     """Escribe Parquet mediante PyArrow sin índice."""
 
-    dataframe.to_parquet(
+    table = pa.Table.from_pandas(dataframe, preserve_index=False)
+    pq.write_table(
+        table,
         destination,
-        index=False,
-        engine="pyarrow",
+        compression=_PARQUET_COMPRESSION,
+        use_dictionary=True,
     )
 
 
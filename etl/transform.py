@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import math
+import re
 from collections.abc import Mapping
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -82,6 +83,11 @@ _OPTIONAL_NUMERIC_RULES: tuple[
     ("wind_direction_deg", 0.0, True, 360.0, False),
 )
 _QualityStatus = Literal["missing", "invalid", "valid"]
+_IQAIR_TIMESTAMP = re.compile(
+    r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d{1,6})?Z"
+)
+_INT64_MIN = -(2**63)
+_INT64_MAX = 2**63 - 1
 
 
 class TransformationError(ValueError):
@@ -344,7 +350,8 @@ def validate_air_quality(
     valid_rows: list[dict[str, Any]] = []
     rejected_rows: list[dict[str, Any]] = []
 
-    for _, row in source_copy.iterrows():
+    for values in source_copy.itertuples(index=False, name=None):
+        row = dict(zip(SCHEMA_COLUMNS, values, strict=True))
         normalized, rejection_reasons = _validate_normalized_record(row)
         if rejection_reasons:
             rejected = {
@@ -377,7 +384,7 @@ def validate_air_quality(
 
 
 def _validate_normalized_record(
-    row: pd.Series,
+    row: Mapping[str, Any],
 ) -> tuple[dict[str, Any], list[str]]:
     """Valida una fila y devuelve valores normalizados y motivos estables."""
 
@@ -488,7 +495,7 @@ def _quality_timestamp(value: Any) -> pd.Timestamp | None:
 def _quality_integer(value: Any) -> tuple[int, _QualityStatus]:
     """Convierte un entero requerido e informa si es válido."""
 
-    if _is_null_scalar(value) or isinstance(value, bool):
+    if _is_null_scalar(value) or pd.api.types.is_bool(value):
         return 0, "missing"
     numeric, status = _quality_number(value)
     if status != "valid" or not numeric.is_integer():
@@ -501,7 +508,7 @@ def _quality_number(value: Any) -> tuple[float, _QualityStatus]:
 
     if _is_null_scalar(value):
         return 0.0, "missing"
-    if isinstance(value, bool):
+    if pd.api.types.is_bool(value):
         return 0.0, "invalid"
     try:
         numeric = float(value)
@@ -643,6 +650,13 @@ def _optional_value(
 def _parse_required_timestamp(value: Any, field_name: str) -> pd.Timestamp:
     """Convierte un timestamp consciente a UTC."""
 
+    if isinstance(value, str) and _IQAIR_TIMESTAMP.fullmatch(value):
+        try:
+            parsed = datetime.fromisoformat(value)
+        except ValueError:
+            raise InvalidTransformTimestampError(field_name) from None
+        return pd.Timestamp(parsed).tz_convert("UTC")
+
     try:
         timestamp = pd.Timestamp(value)
     except (TypeError, ValueError, OverflowError):
@@ -719,6 +733,11 @@ def _nullable_float_series(value: Any) -> pd.Series:
 
     if _is_null_scalar(value):
         return pd.Series([pd.NA], dtype="Float64")
+    if type(value) in (int, float):
+        try:
+            return pd.Series([float(value)], dtype="Float64")
+        except OverflowError:
+            pass
     numeric = pd.to_numeric(pd.Series([value]), errors="coerce")
     if pd.isna(numeric.iloc[0]):
         return pd.Series([value], dtype="object")
@@ -730,6 +749,8 @@ def _nullable_integer_series(value: Any) -> pd.Series:
 
     if _is_null_scalar(value):
         return pd.Series([pd.NA], dtype="Int64")
+    if type(value) is int and _INT64_MIN <= value <= _INT64_MAX:
+        return pd.Series([value], dtype="Int64")
     numeric = pd.to_numeric(pd.Series([value]), errors="coerce").iloc[0]
     if pd.isna(numeric) or not math.isfinite(float(numeric)):
         return pd.Series([value], dtype="object")
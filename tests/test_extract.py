@@ -7,7 +7,7 @@ import json
 import logging
 from collections.abc import Callable, Mapping
 from copy import deepcopy
-from dataclasses import fields
+from dataclasses import fields, replace
 from datetime import UTC, datetime
 from inspect import signature
 from pathlib import Path
@@ -347,6 +347,20 @@ def test_incomplete_minimum_structure_is_rejected(
     assert not settings.paths.raw_dir.exists()
 
 
+def test_unencodable_payload_is_rejected_before_creating_file(
+    settings: Settings,
+    sample_payload: dict[str, Any],
+) -> None:
+    payload = deepcopy(sample_payload)
+    payload["data"]["city"] = "\ud800"
+
+    with pytest.raises(RawDataWriteError) as captured:
+        run_extract(settings, payload)
+
+    assert FAKE_API_KEY not in str(captured.value)
+    assert list(settings.paths.raw_dir.glob("*.json")) == []
+
+
 def test_write_failure_removes_partial_file(
     monkeypatch: pytest.MonkeyPatch,
     settings: Settings,
@@ -368,6 +382,23 @@ def test_write_failure_removes_partial_file(
     assert list(settings.paths.raw_dir.glob("*.json")) == []
 
 
+def test_raw_directory_outside_project_is_rejected(
+    settings: Settings,
+    sample_payload: dict[str, Any],
+    tmp_path_factory: pytest.TempPathFactory,
+) -> None:
+    outside_directory = tmp_path_factory.mktemp("outside")
+    outside_settings = replace(
+        settings,
+        paths=replace(settings.paths, raw_dir=outside_directory),
+    )
+
+    with pytest.raises(ValueError, match="fuera del proyecto"):
+        run_extract(outside_settings, sample_payload)
+
+    assert list(outside_directory.iterdir()) == []
+
+
 def test_api_key_is_absent_from_logs_exceptions_results_and_files(
     settings: Settings,
     sample_payload: dict[str, Any],
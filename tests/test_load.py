@@ -9,6 +9,7 @@ from pathlib import Path
 from typing import Any
 
 import pandas as pd
+import pyarrow.parquet as pq
 import pytest
 from sqlalchemy import URL, create_engine, inspect, select, text
 
@@ -236,6 +237,30 @@ def test_table_has_confirmed_schema_primary_key_and_nullability(
     )
 
 
+def test_load_recreates_database_deleted_between_runs(
+    tmp_path: Path,
+) -> None:
+    database_path = tmp_path / "recreated.db"
+    load_air_quality(make_valid_dataframe(2), database_path=database_path)
+    database_path.unlink()
+
+    result = load_air_quality(
+        make_valid_dataframe(3),
+        database_path=database_path,
+    )
+    export = export_air_quality(
+        make_quality_result(),
+        database_path=database_path,
+        output_directory=tmp_path / "processed",
+    )
+
+    assert database_path.is_file()
+    assert result.transaction_status == "committed"
+    assert result.rows_inserted == 3
+    assert len(read_rows(database_path)) == 3
+    assert export.valid_rows_exported == 3
+
+
 @pytest.mark.parametrize("row_count", [1, 4])
 def test_load_inserts_one_or_multiple_records(
     row_count: int,
@@ -537,6 +562,24 @@ def test_export_creates_csv_parquet_and_rejected_files(
     assert result.errors == ()
 
 
+def test_parquet_export_uses_zstd_compression(tmp_path: Path) -> None:
+    database_path = tmp_path / "zstd.db"
+    load_air_quality(make_valid_dataframe(2), database_path=database_path)
+
+    result = export_air_quality(
+        make_quality_result(),
+        database_path=database_path,
+        output_directory=tmp_path / "processed",
+    )
+    metadata = pq.ParquetFile(result.parquet_path).metadata
+
+    assert all(
+        metadata.row_group(group).column(column).compression == "ZSTD"
+        for group in range(metadata.num_row_groups)
+        for column in range(metadata.num_columns)
+    )
+
+
 def test_valid_exports_match_consolidated_sqlite_history(
     tmp_path: Path,
 ) -> None:
@@ -299,6 +299,44 @@ def test_required_timestamps_must_include_timezone(
         )
 
 
+@pytest.mark.parametrize(
+    ("raw_timestamp", "expected"),
+    [
+        ("2026-07-24T18:00:00.000Z", "2026-07-24T18:00:00Z"),
+        ("2026-07-24T18:00:00.123456Z", "2026-07-24T18:00:00.123456Z"),
+        ("2026-07-24T12:00:00-06:00", "2026-07-24T18:00:00Z"),
+    ],
+)
+def test_pollution_timestamp_formats_normalize_to_same_instant(
+    raw_timestamp: str,
+    expected: str,
+    sample_payload: dict[str, Any],
+) -> None:
+    payload = deepcopy(sample_payload)
+    payload["data"]["current"]["pollution"]["ts"] = raw_timestamp
+
+    result = transform_air_quality(payload, extracted_at=EXTRACTED_AT)
+
+    assert result.dataframe.loc[0, "timestamp_api"] == pd.Timestamp(
+        expected
+    )
+
+
+def test_impossible_iqair_timestamp_is_rejected(
+    sample_payload: dict[str, Any],
+) -> None:
+    payload = deepcopy(sample_payload)
+    payload["data"]["current"]["pollution"]["ts"] = (
+        "2026-13-24T18:00:00.000Z"
+    )
+
+    with pytest.raises(
+        InvalidTransformTimestampError,
+        match="data.current.pollution.ts",
+    ):
+        transform_air_quality(payload, extracted_at=EXTRACTED_AT)
+
+
 def test_dataframe_uses_stable_nullable_dtypes(
     sample_payload: dict[str, Any],
 ) -> None:
@@ -610,6 +648,28 @@ def test_quality_rejects_invalid_present_optional_fields(
     assert result.rejected_records.loc[0, column] == invalid_value
 
 
+@pytest.mark.parametrize(
+    ("column", "expected_valid"),
+    [("aqius", 0), ("temperature_c", 1)],
+)
+def test_quality_rejects_nullable_boolean_numeric_values(
+    column: str,
+    expected_valid: int,
+    normalized_dataframe: pd.DataFrame,
+) -> None:
+    dataframe = pd.concat(
+        [normalized_dataframe, normalized_dataframe],
+        ignore_index=True,
+    )
+    dataframe[column] = pd.array([True, None], dtype="boolean")
+
+    result = validate_air_quality(dataframe)
+
+    assert result.total_valid == expected_valid
+    assert result.total_rejected == 2 - expected_valid
+    assert column in result.rejected_records.loc[0, "rejection_reason"]
+
+
 def test_quality_preserves_multiple_reasons_in_stable_order(
     normalized_dataframe: pd.DataFrame,
 ) -> None: